@@ -8,6 +8,10 @@ visualization, and reporting.
 import sys
 sys.path.append('..')
 
+# Plots are only saved to files, so skip GUI backend setup
+import matplotlib
+matplotlib.use('Agg')
+
 from src import run_batch_analysis
 
 
@@ -17,6 +21,9 @@ def main():
     # Configuration
     GRID_SIZE = 51
     GENERATIONS = 100
+    # Worker processes for the rule sweep (None = all cores). Sequential is
+    # fastest at this size: spawning a worker costs more than the sweep.
+    N_JOBS = 1
     
     # Optional: load existing data instead of re-running
     # LOAD_EXISTING = 'data/all_256_rules_20251227_180000.pkl'
@@ -33,7 +40,7 @@ def main():
     if LOAD_EXISTING:
         print(f"  Mode: Loading existing data")
     else:
-        print(f"  Mode: Running fresh simulation (estimated time: 1-2 hours)")
+        print(f"  Mode: Running fresh simulation (estimated time: under a minute)")
     
     print("\n" + "="*80 + "\n")
     
@@ -41,7 +48,8 @@ def main():
     all_results, classification_df = run_batch_analysis(
         size=GRID_SIZE,
         generations=GENERATIONS,
-        load_existing=LOAD_EXISTING
+        load_existing=LOAD_EXISTING,
+        n_jobs=N_JOBS
     )
     
     # Additional custom analysis can go here
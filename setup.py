@@ -8,9 +8,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "numpy",
-        "scipy",
         "matplotlib",
         "pandas",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     python_requires=">=3.8",
 )
@@ -11,7 +11,8 @@ from .core import (
     create_initial_pattern,
     rule_to_binary,
     apply_rule,
-    analyze_rule_systematic
+    analyze_rule_systematic,
+    analyze_rule_cached
 )
 
 from .classification import (
@@ -35,6 +36,7 @@ __all__ = [
     'rule_to_binary',
     'apply_rule',
     'analyze_rule_systematic',
+    'analyze_rule_cached',
     'classify_rule_v2',
     'classify_all_rules_v2',
     'plot_individual_rule',
@@ -7,12 +7,28 @@ Coordinates data collection, classification, and output generation.
 import pickle
 import os
 from datetime import datetime
-from .core import analyze_rule_systematic
+from functools import partial
+import multiprocessing
+from .core import analyze_rule_cached
 from .classification import classify_all_rules_v2
 from .visualization import plot_classification_summary_v2, print_classification_report_v2, plot_individual_rule
 
 
-def run_all_256_rules(size=51, generations=100, save_data=True):
+def _init_worker(threads):
+    """
+    Cap a sweep worker's compiled kernels at `threads` threads.
+
+    Each worker's numba kernels would otherwise start one thread per core,
+    oversubscribing the CPU n_jobs times over.
+    """
+    try:
+        import numba
+    except ImportError:
+        return
+    numba.set_num_threads(max(1, min(threads, numba.config.NUMBA_NUM_THREADS)))
+
+
+def run_all_256_rules(size=51, generations=100, save_data=True, n_jobs=1):
     """
     Run all 256 rules and collect metrics.
     
@@ -24,33 +40,68 @@ def run_all_256_rules(size=51, generations=100, save_data=True):
         Number of generations (default: 100)
     save_data : bool, optional
         Save raw data to pickle file (default: True)
+    n_jobs : int or None, optional
+        Number of worker processes. Rules are independent, so they can run
+        in parallel; None uses all CPU cores (default: 1, sequential).
+        Workers are spawned, so scripts calling this with n_jobs != 1 need
+        an ``if __name__ == "__main__":`` guard. The cores are split
+        between the workers' compiled kernels, so they do not oversubscribe
+        the CPU. Each worker gets one contiguous block of rules and shares
+        trajectories only within it, so parallel runs give up sharing
+        across blocks. Starting a worker (about a second) costs more than
+        a whole sequential sweep at the default size, so parallel mode
+        only pays off for much larger grids or longer runs
         
     Returns
     -------
     dict
-        Metrics for all 256 rules
+        Metrics for all 256 rules. Sequential runs are memoized per
+        (size, generations, rule), so repeated sweeps reuse earlier results,
+        and rules that evolve identically are simulated only once; the
+        metric arrays are read-only and shared between such rules.
     """
     print(f"{'='*60}")
     print(f"BATCH PROCESSING: All 256 Rules")
     print(f"Grid size: {size}³ = {size**3:,} cells")
     print(f"Generations: {generations}")
+    print(f"Workers: {n_jobs or os.cpu_count() or 1}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
     
-    all_results = {}
-    
-    for rule in range(256):
-        if rule % 10 == 0:
-            print(f"Processing Rule {rule}...")
+    if n_jobs == 1:
+        all_results = {}
         
-        metrics = analyze_rule_systematic(
-            size=size,
-            generations=generations,
-            rule_number=rule,
-            verbose=False
-        )
-        
-        all_results[rule] = metrics
+        for rule in range(256):
+            if rule % 10 == 0:
+                print(f"Processing Rule {rule}...")
+            
+            # Positional, like the parallel worker: lru_cache keys keyword
+            # and positional calls separately
+            metrics = analyze_rule_cached(size, generations, rule)
+            
+            all_results[rule] = metrics
+    else:
+        print("Processing all rules in parallel...")
+        worker = partial(analyze_rule_cached, size, generations)
+        all_results = {}
+        # Spawn fresh workers: forking after numba's thread pool has started
+        # can deadlock the children
+        cores = os.cpu_count() or 1
+        workers = n_jobs or cores
+        threads = cores // workers
+        with multiprocessing.get_context("spawn").Pool(
+            workers, initializer=_init_worker, initargs=(threads,)
+        ) as pool:
+            # Each worker takes one contiguous block of rules, so its own
+            # analyze_rule_cached memo can still share trajectories between
+            # neighboring rules. Only the parent prints, as results arrive.
+            chunksize = -(-256 // workers)
+            results = pool.imap_unordered(worker, range(256), chunksize=chunksize)
+            for done, metrics in enumerate(results, start=1):
+                all_results[metrics["rule_number"]] = metrics
+                if done % 10 == 0:
+                    print(f"Completed {done}/256 rules...")
+        all_results = dict(sorted(all_results.items()))
     
     print(f"\n{'='*60}")
     print(f"COMPLETED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -69,7 +120,7 @@ def run_all_256_rules(size=51, generations=100, save_data=True):
     return all_results
 
 
-def run_batch_analysis(size=51, generations=100, load_existing=None):
+def run_batch_analysis(size=51, generations=100, load_existing=None, n_jobs=1):
     """
     Complete pipeline: run, classify, visualize, and report.
     
@@ -81,6 +132,9 @@ def run_batch_analysis(size=51, generations=100, load_existing=None):
         Number of generations (default: 100)
     load_existing : str, optional
         Path to existing .pkl file to skip computation
+    n_jobs : int or None, optional
+        Worker processes for the rule sweep; None uses all CPU cores
+        (default: 1, sequential)
         
     Returns
     -------
@@ -97,7 +151,7 @@ def run_batch_analysis(size=51, generations=100, load_existing=None):
             all_results = pickle.load(f)
     else:
         print("Running all 256 rules...\n")
-        all_results = run_all_256_rules(size, generations)
+        all_results = run_all_256_rules(size, generations, n_jobs=n_jobs)
     
     # Step 2: Classify
     print("Classifying rules...\n")
@@ -111,7 +165,7 @@ def run_batch_analysis(size=51, generations=100, load_existing=None):
     
     # Step 3: Generate summary visualizations
     print("Generating summary visualizations...\n")
-    plot_classification_summary_v2(classification_df)
+    plot_classification_summary_v2(classification_df, show=False)
     
     # Step 4: Print text report
     print_classification_report_v2(classification_df)
@@ -123,10 +177,9 @@ def run_batch_analysis(size=51, generations=100, load_existing=None):
         (classification_df['mean_variance'] > 0.5)
     ].sort_values('mean_variance', ascending=False).head(5)
     
-    for _, row in interesting.iterrows():
-        rule = int(row['rule'])
+    for rule in interesting['rule'].tolist():
         print(f"  Plotting Rule {rule}...")
-        plot_individual_rule(all_results[rule])
+        plot_individual_rule(all_results[rule], show=False)
     
     print(f"\n{'='*80}")
     print("ANALYSIS COMPLETE!")
@@ -8,6 +8,110 @@ import numpy as np
 import pandas as pd
 
 
+# Classes in decision order: each rule gets the first class whose condition
+# holds in _classify_arrays(), or Class 0 if none does.
+_CLASSES = [
+    ("Class 0: Unclassified", "0"),
+    ("Class 1A: Immediate Extinction", "1A"),
+    ("Class 1B: Delayed Extinction", "1B"),
+    ("Class 2A: Extinction Blink (0↔Full)", "2A"),
+    ("Class 2B: Sparse-Full Blink (N↔Full)", "2B"),
+    ("Class 2C: Static/Local Periodic", "2C"),
+    ("Class 2D: Expanding Oscillator", "2D"),
+    ("Class 2C: Stable Oscillator", "2C"),
+    ("Class 3: Chaotic Turbulent", "3"),
+    ("Class 4A: Structured Expander (Boundary)", "4A"),
+    ("Class 4B: Structured Bounded", "4B"),
+    ("Class 5: Complex Stable", "5"),
+    ("Class 6: Simple Growth", "6"),
+]
+
+
+# Grid volume assumed for metrics saved before size was recorded (51³ grid)
+_DEFAULT_GRID_VOLUME = 51**3
+
+
+def _classify_arrays(total_cells, std_neighbor_count, max_distance_from_center,
+                     grid_volume):
+    """
+    Classify many rules at once from stacked per-generation metrics.
+
+    Parameters
+    ----------
+    total_cells, std_neighbor_count, max_distance_from_center : numpy.ndarray
+        Arrays of shape (n_rules, generations)
+    grid_volume : int or numpy.ndarray
+        Grid volume (size³) of each rule's run
+
+    Returns
+    -------
+    numpy.ndarray
+        Index into _CLASSES for each rule
+    """
+    n_gens = total_cells.shape[1]
+    final_pop = total_cells[:, -1]
+    max_pop = total_cells.max(axis=1)
+    min_pop = total_cells.min(axis=1)
+    final_extent = max_distance_from_center[:, -1]
+
+    # Last-20-generation windows, sliced once (views, no copies)
+    pop_tail = total_cells[:, -20:]
+    variance_tail = std_neighbor_count[:, -20:]
+
+    # Variance metrics
+    mean_variance = np.where(final_pop > 0, variance_tail.mean(axis=1), 0)
+    variance_trend = variance_tail.std(axis=1)
+
+    # Population metrics: distinct values per row of the sorted tail
+    pop_last_20 = np.sort(pop_tail, axis=1)
+    unique_pops = 1 + np.count_nonzero(np.diff(pop_last_20, axis=1), axis=1)
+
+    # Min population after initial growth
+    if n_gens > 20:
+        min_pop_after_growth = total_cells[:, 20:].min(axis=1)
+    else:
+        min_pop_after_growth = min_pop
+
+    # ========================================================================
+    # CLASS 1: EXTINCTION
+    # ========================================================================
+    extinct = final_pop == 0
+    extinct_gen = np.argmax(total_cells == 0, axis=1)
+
+    # ========================================================================
+    # CLASS 2: PERIODIC PATTERNS
+    # ========================================================================
+    fills_grid = max_pop > 0.7 * grid_volume
+    periodic_quiet = (unique_pops < 10) & (mean_variance < 0.5)
+
+    # 2D vs stable 2C: compare late to early population on long runs
+    if n_gens > 40:
+        expanding = pop_tail.mean(axis=1) > 2 * total_cells[:, 10:20].mean(axis=1)
+    else:
+        expanding = np.zeros(len(total_cells), dtype=bool)
+
+    # ========================================================================
+    # CLASS 4: STRUCTURED COMPLEX
+    # ========================================================================
+    structured = (1.3 < mean_variance) & (mean_variance <= 2.0) & (final_pop > 10000)
+
+    conditions = [
+        extinct & (extinct_gen < 5),                                    # 1A
+        extinct,                                                        # 1B
+        fills_grid & (min_pop_after_growth == 0),                       # 2A
+        fills_grid & (min_pop_after_growth > 0) & (min_pop_after_growth < 1000),  # 2B
+        periodic_quiet & (max_pop < 5000),                              # 2C
+        periodic_quiet & expanding,                                     # 2D
+        periodic_quiet,                                                 # 2C
+        (mean_variance > 2.0) & (max_pop > 20000) & (variance_trend > 0.1),  # 3
+        structured & (final_extent > 40),                               # 4A
+        structured,                                                     # 4B
+        (mean_variance >= 1.8) & (variance_trend < 0.1),                # 5
+        (final_pop > 1000) & (mean_variance < 1.3),                     # 6
+    ]
+    return np.select(conditions, np.arange(1, len(_CLASSES)), default=0)
+
+
 def classify_rule_v2(metrics):
     """
     Classify rule behavior based on comprehensive metrics.
@@ -34,106 +138,14 @@ def classify_rule_v2(metrics):
     - Class 5: Complex stable
     - Class 6: Simple growth
     """
-    final_pop = metrics['total_cells'][-1]
-    max_pop = max(metrics['total_cells'])
-    min_pop = min(metrics['total_cells'])
-    final_extent = metrics['max_distance_from_center'][-1]
-    grid_volume = 51**3  # Assuming 51³ grid
-    
-    # Variance metrics
-    mean_variance = np.mean(metrics['std_neighbor_count'][-20:]) if final_pop > 0 else 0
-    variance_trend = np.std(metrics['std_neighbor_count'][-20:])
-    
-    # Population metrics
-    pop_last_20 = metrics['total_cells'][-20:]
-    unique_pops = len(set(pop_last_20))
-    
-    # Min population after initial growth
-    if len(metrics['total_cells']) > 20:
-        min_pop_after_growth = min(metrics['total_cells'][20:])
-    else:
-        min_pop_after_growth = min_pop
-    
-    # ========================================================================
-    # CLASS 1: EXTINCTION
-    # ========================================================================
-    if final_pop == 0:
-        extinct_gen = next((i for i, p in enumerate(metrics['total_cells']) if p == 0), 
-                          len(metrics['total_cells']))
-        if extinct_gen < 5:
-            return ("Class 1A: Immediate Extinction", "1A")
-        else:
-            return ("Class 1B: Delayed Extinction", "1B")
-    
-    # ========================================================================
-    # CLASS 2: PERIODIC PATTERNS
-    # ========================================================================
-    
-    fills_grid = (max_pop > 0.7 * grid_volume)
-    
-    if fills_grid:
-        # 2A: Complete Extinction Blink
-        if min_pop_after_growth == 0:
-            return ("Class 2A: Extinction Blink (0↔Full)", "2A")
-        
-        # 2B: Sparse-to-Full Blink
-        if min_pop_after_growth > 0 and min_pop_after_growth < 1000:
-            return ("Class 2B: Sparse-Full Blink (N↔Full)", "2B")
-    
-    # Check for periodicity
-    if unique_pops < 10:
-        # 2C: Small Static/Periodic
-        if mean_variance < 0.5 and max_pop < 5000:
-            return ("Class 2C: Static/Local Periodic", "2C")
-        
-        # 2D: Expanding Oscillator
-        if mean_variance < 0.5 and max_pop >= 5000:
-            if len(metrics['total_cells']) > 40:
-                early_avg = np.mean(metrics['total_cells'][10:20])
-                late_avg = np.mean(metrics['total_cells'][-20:])
-                if late_avg > early_avg * 2:
-                    return ("Class 2D: Expanding Oscillator", "2D")
-                else:
-                    return ("Class 2C: Stable Oscillator", "2C")
-            else:
-                return ("Class 2C: Stable Oscillator", "2C")
-    
-    # ========================================================================
-    # CLASS 3: CHAOTIC TURBULENT FILL
-    # ========================================================================
-    
-    if mean_variance > 2.0 and max_pop > 20000:
-        if variance_trend > 0.1:
-            return ("Class 3: Chaotic Turbulent", "3")
-    
-    # ========================================================================
-    # CLASS 4: STRUCTURED COMPLEX
-    # ========================================================================
-    
-    if 1.3 < mean_variance <= 2.0 and final_pop > 10000:
-        if final_extent > 40:
-            return ("Class 4A: Structured Expander (Boundary)", "4A")
-        else:
-            return ("Class 4B: Structured Bounded", "4B")
-    
-    # ========================================================================
-    # CLASS 5: COMPLEX STABLE
-    # ========================================================================
-    
-    if mean_variance >= 1.8 and variance_trend < 0.1:
-        return ("Class 5: Complex Stable", "5")
-    
-    # ========================================================================
-    # CLASS 6: SIMPLE GROWTH
-    # ========================================================================
-    
-    if final_pop > 1000 and mean_variance < 1.3:
-        return ("Class 6: Simple Growth", "6")
-    
-    # ========================================================================
-    # UNCLASSIFIED
-    # ========================================================================
-    return ("Class 0: Unclassified", "0")
+    # One-row views of the metric arrays (no copy for ndarray metrics)
+    index = _classify_arrays(
+        np.asarray(metrics['total_cells'])[np.newaxis],
+        np.asarray(metrics['std_neighbor_count'])[np.newaxis],
+        np.asarray(metrics['max_distance_from_center'])[np.newaxis],
+        metrics.get('grid_volume', _DEFAULT_GRID_VOLUME)
+    )[0]
+    return _CLASSES[index]
 
 
 def classify_all_rules_v2(all_results):
@@ -143,7 +155,8 @@ def classify_all_rules_v2(all_results):
     Parameters
     ----------
     all_results : dict
-        Dictionary mapping rule numbers to their metrics
+        Dictionary mapping rule numbers to their metrics. All rules must
+        share the same number of generations.
         
     Returns
     -------
@@ -156,21 +169,43 @@ def classify_all_rules_v2(all_results):
         - mean_variance: Average variance
         - And more...
     """
-    classifications = []
-    
-    for rule, metrics in all_results.items():
-        class_name, class_code = classify_rule_v2(metrics)
-        
-        classifications.append({
-            'rule': rule,
-            'class_code': class_code,
-            'class_name': class_name,
-            'final_population': metrics['total_cells'][-1],
-            'max_population': max(metrics['total_cells']),
-            'min_population': min(metrics['total_cells']),
-            'final_extent': metrics['max_distance_from_center'][-1],
-            'mean_variance': np.mean(metrics['std_neighbor_count'][-20:]) if metrics['total_cells'][-1] > 0 else 0,
-            'mean_density': np.mean(metrics['density'][-20:]) if metrics['total_cells'][-1] > 0 else 0
-        })
-    
-    return pd.DataFrame(classifications)
\ No newline at end of file
+    columns = ['rule', 'class_code', 'class_name', 'final_population',
+               'max_population', 'min_population', 'final_extent',
+               'mean_variance', 'mean_density']
+    if not all_results:
+        return pd.DataFrame(columns=columns)
+
+    rules = list(all_results)
+    lengths = {len(all_results[rule]['total_cells']) for rule in rules}
+    if len(lengths) > 1:
+        raise ValueError(
+            "All rules must share the same number of generations; "
+            f"got lengths {sorted(lengths)}"
+        )
+
+    def stacked(key):
+        return np.stack([all_results[rule][key] for rule in rules])
+
+    total_cells = stacked('total_cells')
+    std_neighbor_count = stacked('std_neighbor_count')
+    max_distance = stacked('max_distance_from_center')
+    density = stacked('density')
+    grid_volume = np.array([
+        all_results[rule].get('grid_volume', _DEFAULT_GRID_VOLUME) for rule in rules
+    ])
+
+    index = _classify_arrays(total_cells, std_neighbor_count, max_distance, grid_volume)
+    names, codes = zip(*_CLASSES)
+    alive = total_cells[:, -1] > 0
+
+    return pd.DataFrame({
+        'rule': rules,
+        'class_code': np.array(codes)[index],
+        'class_name': np.array(names)[index],
+        'final_population': total_cells[:, -1],
+        'max_population': total_cells.max(axis=1),
+        'min_population': total_cells.min(axis=1),
+        'final_extent': max_distance[:, -1],
+        'mean_variance': np.where(alive, std_neighbor_count[:, -20:].mean(axis=1), 0),
+        'mean_density': np.where(alive, density[:, -20:].mean(axis=1), 0)
+    })
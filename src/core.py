@@ -5,8 +5,37 @@ Implements a 3D low-count totalistic CA using 26-neighbor Moore count
 (excludes self), with an 8-bit rule for counts 0–7 and forced death for counts ≥8.
 """
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.ndimage import convolve
+
+try:
+    from . import core_numba
+except ImportError:  # numba is optional; fall back to NumPy kernels
+    core_numba = None
+
+try:
+    from . import core_cuda
+except ImportError:
+    core_cuda = None
+
+# apply_rule steps grids at least this large along every axis on the GPU
+# when one is available; smaller grids do too little work to repay the
+# transfers. analyze_rule_systematic always runs on the CPU (see
+# _step_with_metrics).
+_GPU_MIN_SIZE = 128
+
+
+# Next-state lookup tables for all 256 rules, built once at import.
+# Row r, column c holds bit c of r (LSB maps to count 0); counts 8–26 stay 0.
+_RULE_LUTS = np.zeros((256, 27), dtype=np.uint8)
+_RULE_LUTS[:, :8] = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, None], axis=1
+)[:, ::-1]
+_RULE_LUTS.flags.writeable = False
+
+# Neighbor count of each histogram bin, for count-weighted sums
+_COUNTS = np.arange(27, dtype=np.float64)
 
 
 def create_initial_pattern(size: int) -> np.ndarray:
@@ -21,9 +50,9 @@ def create_initial_pattern(size: int) -> np.ndarray:
     Returns
     -------
     numpy.ndarray
-        3D binary grid with a single live cell at the center
+        3D binary uint8 grid with a single live cell at the center
     """
-    grid = np.zeros((size, size, size), dtype=int)
+    grid = np.zeros((size, size, size), dtype=np.uint8)
     grid[size // 2, size // 2, size // 2] = 1
     return grid
 
@@ -58,7 +87,289 @@ def rule_to_binary(rule_number: int) -> np.ndarray:
     """
     if not 0 <= rule_number <= 255:
         raise ValueError("Rule number must be between 0 and 255")
-    return np.array([int(x) for x in np.binary_repr(rule_number, width=8)], dtype=int)
+    # MSB-first bits are the rule's LUT entries for counts 7 down to 0
+    return _RULE_LUTS[rule_number, 7::-1].astype(int)
+
+
+def _rule_lut(rule_number: int) -> np.ndarray:
+    """
+    Look up the next-state table for a rule, indexed by neighbor count.
+
+    Parameters
+    ----------
+    rule_number : int
+        Rule number (0-255)
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only 27-element uint8 array; entry c is the next state for
+        count c. Entries 8–26 are 0 (counts ≥8 always die).
+    """
+    if not 0 <= rule_number <= 255:
+        raise ValueError("Rule number must be between 0 and 255")
+    return _RULE_LUTS[rule_number]
+
+
+def _pad(grid: np.ndarray) -> np.ndarray:
+    """Copy grid into a uint8 array with one dead cell of padding per face."""
+    nz, ny, nx = grid.shape
+    padded = np.zeros((nz + 2, ny + 2, nx + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1, 1:-1] = grid
+    return padded
+
+
+def _mirror_low_faces(padded: np.ndarray) -> None:
+    """
+    Refill the low-side padding of an octant grid with its mirror image.
+
+    Index 0 along each axis stands for the cell at -1 from the center, which
+    mirrors the cell at +1 (padded index 2). Copying whole planes one axis
+    at a time also fills the edges and corners of the padding.
+    """
+    padded[0] = padded[2]
+    padded[:, 0] = padded[:, 2]
+    padded[:, :, 0] = padded[:, :, 2]
+
+
+def _live_box(grid: np.ndarray):
+    """Bounding box of the live cells of grid as per-axis slices, or None."""
+    box = []
+    for axis in range(3):
+        others = tuple(a for a in range(3) if a != axis)
+        occupied = np.flatnonzero(grid.any(axis=others))
+        if occupied.size == 0:
+            return None
+        box.append(slice(occupied[0], occupied[-1] + 1))
+    return tuple(box)
+
+
+def _grow(box: tuple, n: int) -> tuple:
+    """Widen per-axis slices by one cell on each side, clipped to [0, n)."""
+    return tuple(slice(max(s.start - 1, 0), min(s.stop + 1, n)) for s in box)
+
+
+def _metric_fields(axis_weights: tuple, center: tuple) -> tuple:
+    """
+    Per-cell weight and squared distance from center, for a whole grid.
+
+    Built once per run for the NumPy reduction, which then reads both with
+    the live-cell mask instead of recomputing them from coordinates each
+    generation.
+
+    Returns
+    -------
+    tuple
+        (cell_weights, dist_sq): float64 wz[z] * wy[y] * wx[x] and int32
+        squared distance, each of shape (len(wz), len(wy), len(wx))
+    """
+    wz, wy, wx = axis_weights
+    cell_weights = (
+        wz[:, None, None] * wy[None, :, None] * wx[None, None, :]
+    ).astype(np.float64)
+    dz, dy, dx = (
+        (np.arange(len(w)) - c) ** 2 for w, c in zip(axis_weights, center)
+    )
+    dist_sq = (dz[:, None, None] + dy[None, :, None] + dx[None, None, :]).astype(np.int32)
+    return cell_weights, dist_sq
+
+
+def _region_args(
+    region: tuple,
+    axis_weights: tuple,
+    center: tuple,
+    fields
+) -> tuple:
+    """
+    Per-region values for analyze_rule_systematic, recomputed only when
+    the active region changes.
+
+    Returns
+    -------
+    tuple
+        (weights, center, fields): the axis weights sliced to the region,
+        the center relative to the region's origin, and views of the
+        _metric_fields() arrays over the region (None if fields is None)
+    """
+    return (
+        tuple(w[s] for w, s in zip(axis_weights, region)),
+        tuple(c - s.start for c, s in zip(center, region)),
+        None if fields is None else tuple(f[region] for f in fields),
+    )
+
+
+def _padded_view(padded: np.ndarray, region: tuple) -> np.ndarray:
+    """View of a padded grid covering region (interior slices) plus its halo."""
+    return padded[tuple(slice(s.start, s.stop + 2) for s in region)]
+
+
+@lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    # Probed lazily, on the first apply_rule call big enough for the GPU:
+    # creating a CUDA context is slow and holds device memory, so processes
+    # that never step a large grid (including every sweep worker) skip it.
+    return core_cuda is not None and core_cuda.is_available()
+
+
+def _use_gpu(shape: tuple) -> bool:
+    """
+    Return True if apply_rule should step a grid of this shape on the GPU.
+    """
+    return min(shape) >= _GPU_MIN_SIZE and _cuda_available()
+
+
+def _neighbor_count(padded: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Count live cells among the 26 Moore neighbors of every cell.
+
+    Parameters
+    ----------
+    padded : numpy.ndarray
+        3D binary uint8 array with one dead cell of padding on every face
+    out : numpy.ndarray
+        uint8 array of the unpadded grid shape receiving the counts (0–26)
+
+    Returns
+    -------
+    numpy.ndarray
+        out
+
+    Notes
+    -----
+    Equivalent to convolving with a 3×3×3 all-ones kernel whose center is 0,
+    using constant-zero boundaries. The all-ones kernel is separable, so the
+    27-cell box sum is taken as three 3-wide sums along successive axes (6
+    uint8 additions per cell instead of 26), then the cell itself is
+    subtracted.
+    """
+    # Box sums along z, then y, then x; the maximum of 27 fits in uint8
+    sum_z = padded[:-2] + padded[1:-1]
+    sum_z += padded[2:]
+    sum_zy = sum_z[:, :-2] + sum_z[:, 1:-1]
+    sum_zy += sum_z[:, 2:]
+    np.add(sum_zy[:, :, :-2], sum_zy[:, :, 1:-1], out=out)
+    out += sum_zy[:, :, 2:]
+
+    out -= padded[1:-1, 1:-1, 1:-1]
+    return out
+
+
+def _step(
+    padded: np.ndarray,
+    out: np.ndarray,
+    lut: np.ndarray,
+    neighbor_count: np.ndarray
+) -> None:
+    """
+    Advance a padded grid by one generation using a rule lookup table.
+
+    Writes the next generation into out (unpadded shape). Large grids run on
+    the GPU when one is available; otherwise uses the fused Numba kernel when
+    numba is installed, or counts neighbors into the neighbor_count scratch
+    buffer and gathers through the LUT.
+    """
+    if _use_gpu(out.shape):
+        core_cuda.step(padded, out, lut)
+    elif core_numba is not None:
+        core_numba.step(padded, out, lut)
+    else:
+        _neighbor_count(padded, neighbor_count)
+        # Counts never exceed 26, so "clip" only skips out's write buffering
+        np.take(lut, neighbor_count, out=out, mode="clip")
+
+
+def _reduce_metrics(
+    grid: np.ndarray,
+    neighbor_count: np.ndarray,
+    fields: tuple
+) -> tuple:
+    """
+    Reduce the live cells of a grid to the raw sums behind its metrics.
+
+    fields holds the grid's _metric_fields(): each cell counts as its
+    weight, so an octant grid reduces to the sums of the full grid it
+    stands for, and distances come from its squared-distance field.
+
+    Returns
+    -------
+    tuple
+        (total, count_sum, count_sq_sum, count_max, count_min, count_eq_1,
+        max_dist) over live cells, as Python scalars
+    """
+    cell_weights, dist_sq = fields
+
+    # One boolean view of the live cells selects counts, weights, and
+    # distances alike, with no per-generation coordinate arrays
+    live = grid.view(bool)
+
+    # Counts are 0–26, so one weighted histogram yields every count
+    # statistic. Its float64 bins hold integers far below 2**53, so the
+    # sums stay exact.
+    hist = np.bincount(
+        neighbor_count[live], weights=cell_weights[live], minlength=27
+    )
+    present = np.flatnonzero(hist)
+    if present.size == 0:
+        return (0, 0, 0, 0, 0, 0, 0.0)
+    total = int(hist.sum())
+    count_sum = int(hist @ _COUNTS)
+    count_sq_sum = int(hist @ (_COUNTS * _COUNTS))
+
+    # sqrt is monotonic, so take it once on the largest squared distance
+    max_dist_sq = dist_sq[live].max()
+    return (
+        total,
+        count_sum,
+        count_sq_sum,
+        int(present[-1]),
+        int(present[0]),
+        int(hist[1]),
+        float(np.sqrt(max_dist_sq)),
+    )
+
+
+def _step_with_metrics(
+    padded: np.ndarray,
+    out: np.ndarray,
+    lut: np.ndarray,
+    neighbor_count: np.ndarray,
+    axis_weights: tuple,
+    center: tuple,
+    fields,
+    track_counts: bool = True,
+    symmetric: bool = False
+) -> tuple:
+    """
+    Reduce the metrics of a padded grid and write its next generation.
+
+    fields is the grid's _metric_fields(), used by the NumPy path; the
+    compiled pass takes axis_weights and center instead, and gets None.
+
+    Returns _reduce_metrics' sums for the grid in padded (all zero if it is
+    empty), followed by a bitmask of the neighbor counts met anywhere in it
+    (bit c set for count c). Uses the fused compiled pass when numba is
+    installed; otherwise counts neighbors once into the neighbor_count
+    scratch buffer and reuses the counts for the reduction, the LUT
+    gather, and the bitmask. The NumPy path skips the bitmask (returning
+    0) unless track_counts is set; the compiled pass always fills it.
+    If symmetric, the grid is unchanged by permuting its axes, and the
+    compiled pass only counts one sixth of it.
+
+    Never uses the GPU: its kernel only counts neighbors, so the gather,
+    the reduction, and two host-device copies per generation would all
+    come on top, where the fused CPU pass does everything in one sweep.
+    """
+    if core_numba is not None:
+        kernel = core_numba.step_metrics_symmetric if symmetric else core_numba.step_metrics
+        return kernel(padded, out, lut, *axis_weights, *center)
+
+    _neighbor_count(padded, neighbor_count)
+    np.take(lut, neighbor_count, out=out, mode="clip")
+    sums = _reduce_metrics(padded[1:-1, 1:-1, 1:-1], neighbor_count, fields)
+    if not track_counts:
+        return sums + (0,)
+    present = np.flatnonzero(np.bincount(neighbor_count.ravel(), minlength=27))
+    return sums + (int(np.left_shift(1, present).sum()),)
 
 
 def apply_rule(grid: np.ndarray, rule_number: int) -> np.ndarray:
@@ -75,7 +386,7 @@ def apply_rule(grid: np.ndarray, rule_number: int) -> np.ndarray:
     Returns
     -------
     numpy.ndarray
-        Next generation grid
+        Next generation grid (uint8)
 
     Notes
     -----
@@ -83,16 +394,9 @@ def apply_rule(grid: np.ndarray, rule_number: int) -> np.ndarray:
     Update is state-independent: next state depends only on neighbor count.
     Counts 0–7 are mapped by the 8-bit rule; counts ≥8 remain 0 (dead).
     """
-    kernel = np.ones((3, 3, 3))
-    kernel[1, 1, 1] = 0  # Exclude self → true 26-neighbor count
-    
-    neighbor_count = convolve(grid, kernel, mode="constant", cval=0)
-    rule = rule_to_binary(rule_number)
-
-    new_grid = np.zeros_like(grid)
-    for c in range(8):
-        new_grid[neighbor_count == c] = rule[7 - c]
-
+    new_grid = np.empty(grid.shape, dtype=np.uint8)
+    neighbor_count = np.empty(grid.shape, dtype=np.uint8)
+    _step(_pad(grid), new_grid, _rule_lut(rule_number), neighbor_count)
     return new_grid
 
 
@@ -119,7 +423,10 @@ def analyze_rule_systematic(
     Returns
     -------
     dict
-        Metrics per generation including:
+        rule_number, size, and grid_volume (size³), plus per-generation
+        metrics, each stored as a NumPy array of length ``generations``
+        (generation t is the state after t rule applications):
+        - generation: Generation index (1-based)
         - total_cells: Population count
         - mean_neighbor_count: Average neighbor count among live cells
         - max_neighbor_count: Max neighbor count among live cells
@@ -128,78 +435,263 @@ def analyze_rule_systematic(
         - density: Structural density (spherical approximation)
         - cells_count_eq_1: Live cells whose neighbor count == 1
         - std_neighbor_count: Neighbor count standard deviation among live cells
+
+    Notes
+    -----
+    On odd sizes the seed, the rule, and the dead border are all symmetric
+    under reflecting any axis through the center, so every generation is
+    too. Only the octant on the high side of the center is simulated (1/8
+    of the cells), with its low faces padded by reflection; in the metrics
+    each octant cell stands for its 2, 4, or 8 mirror images. The octant
+    is also unchanged by permuting its axes, so the compiled pass counts
+    only the cells with z >= y >= x and copies each result to its
+    permutations.
+
+    Unless count 0 is a birth count, each generation only counts and
+    updates the live cells' bounding box grown by one cell, which keeps
+    sparse and early-expansion generations cheap on large grids. Once a
+    generation repeats either of the two before it (a fixed point or a
+    period-2 blinker), the remaining metrics are filled in by repetition
+    instead of being simulated.
+    """
+    metrics, _ = _run_rule(size, generations, rule_number, verbose, track_counts=False)
+    return metrics
+
+
+def _run_rule(
+    size: int,
+    generations: int,
+    rule_number: int,
+    verbose: bool = False,
+    track_counts: bool = True
+) -> tuple:
     """
-    grid = create_initial_pattern(size)
-    kernel = np.ones((3, 3, 3))
-    kernel[1, 1, 1] = 0  # Exclude self → 26-neighbor count
-    rule = rule_to_binary(rule_number)
+    analyze_rule_systematic, also reporting which neighbor counts occurred.
 
+    Returns
+    -------
+    tuple
+        (metrics, counts_seen): counts_seen has bit c set if some cell had
+        neighbor count c in some generation. A rule that agrees with
+        rule_number on all of those counts follows the same trajectory.
+        Without track_counts the NumPy backend skips the bookkeeping and
+        counts_seen is unreliable.
+    """
+    lut = _rule_lut(rule_number)
+
+    octant = size % 2 == 1
+    if octant:
+        # Local index i along each axis is global index size // 2 + i
+        n = size // 2 + 1
+        initial = np.zeros((n, n, n), dtype=np.uint8)
+        initial[0, 0, 0] = 1
+        center = (0, 0, 0)
+        # Cells off the center plane of an axis have a mirror twin
+        axis_weight = np.full(n, 2, dtype=np.int64)
+        axis_weight[0] = 1
+    else:
+        n = size
+        initial = create_initial_pattern(size)
+        center = (size // 2, size // 2, size // 2)
+        axis_weight = np.ones(n, dtype=np.int64)
+    axis_weights = (axis_weight, axis_weight, axis_weight)
+
+    # Double-buffered padded grids: each step writes the interior of the
+    # spare buffer, so borders stay dead and nothing is allocated per step.
+    current = _pad(initial)
+    spare = np.zeros_like(current)
+    neighbor_count = np.empty((n, n, n), dtype=np.uint8)
+
+    # Preallocated per-generation arrays; zeros are the extinct-grid values
     metrics = {
         "rule_number": rule_number,
-        "generation": [],
-        "total_cells": [],
-        "mean_neighbor_count": [],
-        "max_neighbor_count": [],
-        "min_neighbor_count": [],
-        "max_distance_from_center": [],
-        "density": [],
-        "cells_count_eq_1": [],
-        "std_neighbor_count": [],
+        "size": size,
+        "grid_volume": size ** 3,
+        "generation": np.arange(1, generations + 1),
+        "total_cells": np.zeros(generations, dtype=np.int64),
+        "mean_neighbor_count": np.zeros(generations, dtype=np.float64),
+        "max_neighbor_count": np.zeros(generations, dtype=np.int64),
+        "min_neighbor_count": np.zeros(generations, dtype=np.int64),
+        "max_distance_from_center": np.zeros(generations, dtype=np.float64),
+        "density": np.zeros(generations, dtype=np.float64),
+        "cells_count_eq_1": np.zeros(generations, dtype=np.int64),
+        "std_neighbor_count": np.zeros(generations, dtype=np.float64),
     }
 
-    center = np.array([size // 2, size // 2, size // 2])
-
-    for gen in range(generations):
-        # Compute neighbor count for CURRENT grid
-        neighbor_count = convolve(grid, kernel, mode="constant", cval=0)
-
-        # Apply rule (counts 0–7 only; counts ≥8 remain 0)
-        new_grid = np.zeros_like(grid)
-        for c in range(8):
-            new_grid[neighbor_count == c] = rule[7 - c]
-        grid = new_grid
-
-        # Recompute neighbor count for UPDATED grid so metrics align
-        neighbor_count = convolve(grid, kernel, mode="constant", cval=0)
-
-        # Population
-        total = int(np.sum(grid))
-        metrics["generation"].append(gen + 1)
-        metrics["total_cells"].append(total)
-
-        if total > 0:
-            occupied = np.argwhere(grid == 1)
-            neighbor_counts_active = neighbor_count[grid == 1]
-
-            # Spatial extent
-            distances = np.linalg.norm(occupied - center, axis=1)
-            max_dist = float(distances.max())
+    if octant:
+        _mirror_low_faces(current)
+
+    # Active region: unless count 0 is a birth count, a cell can only be
+    # alive next generation if it is within one cell of a live cell now. So
+    # each step covers just the live bounding box grown by one cell, which
+    # is far smaller than the grid while a pattern is sparse.
+    whole = (slice(0, n),) * 3
+    box = tuple(slice(c, c + 1) for c in center) if lut[0] == 0 else whole
+    region = _grow(box, n)
+    # Per-cell weights and squared distances for the NumPy reduction,
+    # computed once here rather than from live-cell coordinates each step
+    fields = _metric_fields(axis_weights, center) if core_numba is None else None
+    region_weights, region_center, region_fields = _region_args(
+        region, axis_weights, center, fields
+    )
+    old_box = None  # Live box of the grid held in spare, once there is one
+    counts_seen = 0
+    # Interior bytes of the last two generations, newest first
+    recent = [current[1:-1, 1:-1, 1:-1].tobytes()]
+    series = [v for k, v in metrics.items() if isinstance(v, np.ndarray) and k != "generation"]
+
+    # Pass t reduces the metrics of generation t (the grid in current, with
+    # generation 0 the seed) and writes generation t + 1 into spare. Each
+    # grid's neighbor counts are computed once and serve both.
+    for t in range(generations + 1):
+        interior = spare[1:-1, 1:-1, 1:-1]
+        if old_box is not None and region != whole:
+            # Clear the stale generation outside the region written below
+            interior[old_box] = 0
+        (total, count_sum, count_sq_sum, count_max, count_min,
+         count_eq_1, max_dist, seen) = _step_with_metrics(
+            _padded_view(current, region),
+            interior[region],
+            lut,
+            neighbor_count[region],
+            region_weights,
+            region_center,
+            region_fields,
+            # Once all rule-addressable counts 0–7 occur, no other rule
+            # can share this trajectory
+            track_counts and counts_seen & 0xFF != 0xFF,
+            symmetric=octant,
+        )
+        # Cells outside the region all have count 0
+        counts_seen |= seen if region == whole else seen | 1
+        current, spare = spare, current
+        old_box = box
+        if octant:
+            _mirror_low_faces(current)
+
+        # Generation 0, the seed, has no row in the metric arrays
+        gen = t - 1
+        if total > 0 and t > 0:
+            # Population
+            metrics["total_cells"][gen] = total
 
             # Density (spherical approximation around center)
             volume = (4 / 3) * np.pi * (max_dist ** 3) if max_dist > 0 else 1.0
             density = float(total / volume)
 
-            metrics["mean_neighbor_count"].append(float(neighbor_counts_active.mean()))
-            metrics["max_neighbor_count"].append(int(neighbor_counts_active.max()))
-            metrics["min_neighbor_count"].append(int(neighbor_counts_active.min()))
-            metrics["max_distance_from_center"].append(max_dist)
-            metrics["density"].append(density)
-            metrics["cells_count_eq_1"].append(int(np.sum(neighbor_counts_active == 1)))
-            metrics["std_neighbor_count"].append(float(neighbor_counts_active.std()))
+            # Population variance from exact integer sums: n·Σc² − (Σc)²
+            metrics["mean_neighbor_count"][gen] = count_sum / total
+            metrics["max_neighbor_count"][gen] = count_max
+            metrics["min_neighbor_count"][gen] = count_min
+            metrics["max_distance_from_center"][gen] = max_dist
+            metrics["density"][gen] = density
+            metrics["cells_count_eq_1"][gen] = count_eq_1
+            metrics["std_neighbor_count"][gen] = (
+                np.sqrt(total * count_sq_sum - count_sum ** 2) / total
+            )
 
             if verbose and (gen + 1) % 10 == 0:
                 print(f"  Gen {gen+1}: {total} cells, max_dist={max_dist:.1f}")
-        else:
-            # Extinct
-            metrics["mean_neighbor_count"].append(0.0)
-            metrics["max_neighbor_count"].append(0)
-            metrics["min_neighbor_count"].append(0)
-            metrics["max_distance_from_center"].append(0.0)
-            metrics["density"].append(0.0)
-            metrics["cells_count_eq_1"].append(0)
-            metrics["std_neighbor_count"].append(0.0)
-
+        elif total == 0:
+            # Extinct: metrics stay at their preallocated zeros
             if verbose:
                 print(f"  Gen {gen+1}: EXTINCT")
 
+            # An empty grid stays empty unless count 0 is a birth count, so
+            # the remaining generations are already filled in.
+            if lut[0] == 0:
+                break
+
+        # A fixed point or blinker: generation t + 1 repeats generation
+        # t + 1 - period, so every later metric row repeats the rows one
+        # period back. Fill them in and stop (when that generation has rows).
+        state = current[1:-1, 1:-1, 1:-1].tobytes()
+        period = next((p for p, old in enumerate(recent, start=1) if old == state), None)
+        if period is not None and t >= period:
+            for values in series:
+                values[t:] = np.resize(values[t - period:t], generations - t)
+            if verbose:
+                print(f"  Gen {t+1}: period {period}, repeats to the end")
+            break
+        recent = [state, recent[0]]
+
+        # Track the live box of generation t + 1 until the region first
+        # spans the grid, then keep the whole grid: a grid-filling pattern
+        # gains nothing from re-measuring it every generation.
+        if region != whole:
+            live_box = _live_box(current[1:-1, 1:-1, 1:-1][region])
+            if live_box is not None:
+                box = tuple(
+                    slice(r.start + b.start, r.start + b.stop)
+                    for r, b in zip(region, live_box)
+                )
+                grown = _grow(box, n)
+                if grown != region:
+                    region = grown
+                    region_weights, region_center, region_fields = _region_args(
+                        region, axis_weights, center, fields
+                    )
+
+    return metrics, counts_seen
+
+
+# Rules simulated by analyze_rule_cached, as lists of (rule, counts_seen,
+# metrics) keyed by (size, generations). Only the _MAX_TRAJECTORY_KEYS most
+# recently added keys are kept; the oldest key is evicted first.
+_MAX_TRAJECTORY_KEYS = 4
+_TRAJECTORIES = {}
+
+
+def analyze_rule_cached(size: int, generations: int, rule_number: int) -> dict:
+    """
+    Memoized analyze_rule_systematic, keyed by (size, generations, rule).
+
+    Parameters
+    ----------
+    size : int
+        Grid dimension
+    generations : int
+        Number of generations to simulate
+    rule_number : int
+        Rule to analyze (0-255)
+
+    Returns
+    -------
+    dict
+        Metrics as returned by analyze_rule_systematic(). Every call
+        returns a new dict, but the metric arrays in it are shared with
+        other calls and rules, so they are made read-only.
+
+    Notes
+    -----
+    From a single seed most rules only ever meet a few neighbor counts, and
+    rules that agree on those counts evolve identically; at size 51 the
+    256 rules follow fewer than 100 distinct trajectories. A rule that
+    matches an already simulated rule on every count that rule met reuses
+    its metric arrays instead of being simulated.
+    """
+    # Arguments reach the cache positionally, so keyword and positional
+    # calls share entries
+    return dict(_analyze_rule_memo(size, generations, rule_number))
+
+
+@lru_cache(maxsize=1024)
+def _analyze_rule_memo(size: int, generations: int, rule_number: int) -> dict:
+    """analyze_rule_cached's memo; callers get copies of the dicts it holds."""
+    key = (size, generations)
+    if key not in _TRAJECTORIES:
+        if len(_TRAJECTORIES) >= _MAX_TRAJECTORY_KEYS:
+            # Dicts keep insertion order, so the first key is the oldest
+            del _TRAJECTORIES[next(iter(_TRAJECTORIES))]
+        _TRAJECTORIES[key] = []
+    runs = _TRAJECTORIES[key]
+    for source, counts_seen, source_metrics in runs:
+        if (rule_number ^ source) & counts_seen == 0:
+            return dict(source_metrics, rule_number=rule_number)
+
+    metrics, counts_seen = _run_rule(size, generations, rule_number)
+    for value in metrics.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    runs.append((rule_number, counts_seen, metrics))
     return metrics
@@ -0,0 +1,89 @@
+"""
+CUDA kernels for the cellular automaton simulation engine.
+
+Optional GPU accelerator for core.py, built on numba.cuda. The stencil is
+perfectly data-parallel, so large grids run one thread per cell with each
+block's neighborhood staged in shared memory.
+"""
+
+import numpy as np
+from numba import cuda, uint8
+
+# Threads per block along each axis, and the shared tile edge with its halo
+TILE = 8
+_HALO = TILE + 2
+
+
+def is_available() -> bool:
+    """Return True if a usable CUDA device is present."""
+    return cuda.is_available()
+
+
+@cuda.jit
+def _step_kernel(padded, out, lut):
+    tile = cuda.shared.array((_HALO, _HALO, _HALO), dtype=uint8)
+    tx = cuda.threadIdx.x
+    ty = cuda.threadIdx.y
+    tz = cuda.threadIdx.z
+    x0 = cuda.blockIdx.x * TILE
+    y0 = cuda.blockIdx.y * TILE
+    z0 = cuda.blockIdx.z * TILE
+
+    # Cooperatively stage this block's cells plus a one-cell halo, so each
+    # global read is shared by up to 27 neighboring threads.
+    for i in range((tz * TILE + ty) * TILE + tx, _HALO * _HALO * _HALO, TILE * TILE * TILE):
+        lz = i // (_HALO * _HALO)
+        ly = (i // _HALO) % _HALO
+        lx = i % _HALO
+        gz = z0 + lz
+        gy = y0 + ly
+        gx = x0 + lx
+        if gz < padded.shape[0] and gy < padded.shape[1] and gx < padded.shape[2]:
+            tile[lz, ly, lx] = padded[gz, gy, gx]
+        else:
+            tile[lz, ly, lx] = 0
+    cuda.syncthreads()
+
+    z = z0 + tz
+    y = y0 + ty
+    x = x0 + tx
+    if z < out.shape[0] and y < out.shape[1] and x < out.shape[2]:
+        s = 0
+        for dz in range(3):
+            for dy in range(3):
+                for dx in range(3):
+                    s += tile[tz + dz, ty + dy, tx + dx]
+        s -= tile[tz + 1, ty + 1, tx + 1]
+        out[z, y, x] = lut[s]
+
+
+def step(padded, out, lut):
+    """
+    Advance a grid by one generation on the GPU.
+
+    Parameters
+    ----------
+    padded : numpy.ndarray
+        Current state as a uint8 array with one dead cell of padding on
+        every face, shape (Z+2, Y+2, X+2); may be a strided view
+    out : numpy.ndarray
+        uint8 array of shape (Z, Y, X) receiving the next generation
+    lut : numpy.ndarray
+        27-entry lookup table indexed by neighbor count
+
+    Notes
+    -----
+    Same contract as core_numba.step. Launches (8, 8, 8) thread blocks, with
+    x mapped to the last (contiguous) axis so global loads coalesce.
+    """
+    nz, ny, nx = out.shape
+    # Transfers need one contiguous buffer; region views are copied first
+    d_padded = cuda.to_device(np.ascontiguousarray(padded))
+    d_out = cuda.device_array((nz, ny, nx), dtype=np.uint8)
+    blocks = (
+        (nx + TILE - 1) // TILE,
+        (ny + TILE - 1) // TILE,
+        (nz + TILE - 1) // TILE,
+    )
+    _step_kernel[blocks, (TILE, TILE, TILE)](d_padded, d_out, cuda.to_device(lut))
+    out[...] = d_out.copy_to_host()
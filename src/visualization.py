@@ -9,7 +9,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 
-def plot_individual_rule(metrics, save=True):
+def plot_individual_rule(metrics, save=True, show=True):
     """
     Generate detailed 6-panel analysis plot for a single rule.
     
@@ -19,6 +19,9 @@ def plot_individual_rule(metrics, save=True):
         Metrics from analyze_rule_systematic()
     save : bool, optional
         Save plot to file (default: True)
+    show : bool, optional
+        Display the plot with plt.show() (default: True); batch runs pass
+        False
         
     Notes
     -----
@@ -32,7 +35,11 @@ def plot_individual_rule(metrics, save=True):
     """
     rule_number = metrics['rule_number']
     
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    # Redraw one named figure per call instead of opening a new one, so
+    # plotting many rules does not accumulate figures
+    fig = plt.figure('Rule analysis', figsize=(15, 10))
+    fig.clear()
+    axes = fig.subplots(2, 3)
     fig.suptitle(f'Rule {rule_number} Analysis - 26-Neighbor Moore Count', 
                  fontsize=16, fontweight='bold')
     
@@ -91,10 +98,11 @@ def plot_individual_rule(metrics, save=True):
         plt.savefig(filename, dpi=150, bbox_inches='tight')
         print(f"Plot saved: {filename}")
     
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_classification_summary_v2(df, save=True):
+def plot_classification_summary_v2(df, save=True, show=True):
     """
     Create comprehensive summary visualization of all 256 rules.
     
@@ -104,8 +112,11 @@ def plot_classification_summary_v2(df, save=True):
         Classification results from classify_all_rules_v2()
     save : bool, optional
         Save plot to file (default: True)
+    show : bool, optional
+        Display the plot with plt.show() (default: True)
     """
-    fig = plt.figure(figsize=(18, 12))
+    fig = plt.figure('256-rule summary', figsize=(18, 12))
+    fig.clear()
     
     # 1. Class distribution pie chart
     ax1 = plt.subplot(3, 3, 1)
@@ -145,10 +156,8 @@ def plot_classification_summary_v2(df, save=True):
     
     # 5. Variance distribution by class
     ax5 = plt.subplot(3, 3, 5)
-    for class_code in sorted(df['class_code'].unique()):
-        subset = df[df['class_code'] == class_code]['mean_variance']
-        if len(subset) > 0:
-            ax5.hist(subset, bins=20, alpha=0.5, label=class_code)
+    for class_code, subset in df.groupby('class_code')['mean_variance']:
+        ax5.hist(subset, bins=20, alpha=0.5, label=class_code)
     ax5.set_xlabel('Mean Variance')
     ax5.set_ylabel('Count')
     ax5.set_title('Variance Distribution by Class', fontweight='bold')
@@ -164,12 +173,12 @@ def plot_classification_summary_v2(df, save=True):
                                                                ascending=False).head(15)
     
     table_data = []
-    for _, row in interesting.iterrows():
+    for row in interesting.itertuples(index=False):
         table_data.append([
-            int(row['rule']),
-            row['class_code'],
-            f"{int(row['final_population']):,}",
-            f"{row['mean_variance']:.2f}"
+            int(row.rule),
+            row.class_code,
+            f"{int(row.final_population):,}",
+            f"{row.mean_variance:.2f}"
         ])
     
     if len(table_data) > 0:
@@ -209,7 +218,8 @@ def plot_classification_summary_v2(df, save=True):
         plt.savefig(filename, dpi=150, bbox_inches='tight')
         print(f"Summary plot saved: {filename}")
     
-    plt.show()
+    if show:
+        plt.show()
 
 
 def print_classification_report_v2(df):
@@ -228,13 +238,13 @@ def print_classification_report_v2(df):
     print("OVERALL STATISTICS:")
     print(f"Total rules analyzed: {len(df)}")
     print(f"Unique classes found: {df['class_code'].nunique()}")
-    print(f"Rules with sustained growth: {len(df[df['final_population'] > 0])}")
-    print(f"Rules reaching boundary: {len(df[df['final_extent'] > 40])}\n")
+    print(f"Rules with sustained growth: {(df['final_population'] > 0).sum()}")
+    print(f"Rules reaching boundary: {(df['final_extent'] > 40).sum()}\n")
     
+    # One grouping pass instead of filtering the whole frame per class
     print("CLASS BREAKDOWN:")
-    for class_code in sorted(df['class_code'].unique()):
-        subset = df[df['class_code'] == class_code]
-        class_name = subset.iloc[0]['class_name']
+    for class_code, subset in df.groupby('class_code'):
+        class_name = subset['class_name'].iloc[0]
         print(f"\n{class_code}: {class_name} - {len(subset)} rules")
         
         rule_list = sorted(subset['rule'].values)
@@ -256,10 +266,10 @@ def print_classification_report_v2(df):
                      (df['mean_variance'] > 0.5)].sort_values('mean_variance', 
                                                                ascending=False)
     
-    for idx, row in interesting.head(20).iterrows():
-        print(f"\nRule {int(row['rule'])}: {row['class_name']}")
-        print(f"  Pop: {int(row['final_population']):,} | "
-              f"Extent: {row['final_extent']:.1f} | "
-              f"Variance: {row['mean_variance']:.3f}")
+    for row in interesting.head(20).itertuples(index=False):
+        print(f"\nRule {int(row.rule)}: {row.class_name}")
+        print(f"  Pop: {int(row.final_population):,} | "
+              f"Extent: {row.final_extent:.1f} | "
+              f"Variance: {row.mean_variance:.3f}")
     
     print(f"\n{'='*80}\n")